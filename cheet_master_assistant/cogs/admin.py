@@ -0,0 +1,84 @@
+import discord
+from discord.ext import commands
+from discord import app_commands
+from config import EXTENSIONS
+from helpers import ensure_owner
+
+class Admin(commands.GroupCog, group_name="extensions", group_description="Zarządzanie rozszerzeniami bota (tylko właściciel)"):
+    """Owner-only commands for loading, unloading and hot-reloading extensions"""
+    
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        super().__init__()
+    
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        return await ensure_owner(interaction)
+    
+    async def _run(self, interaction: discord.Interaction, action: str, extension: str):
+        """Run a load/unload/reload action and resync the command tree if it changed"""
+        if extension == __name__ and action == "unload":
+            await interaction.response.send_message("❌ Nie można wyładować rozszerzenia administracyjnego!", ephemeral=True)
+            return
+        
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        
+        try:
+            elapsed_ms = await self.bot.run_extension_action(action, extension)
+        except commands.ExtensionError as e:
+            await interaction.followup.send(f"❌ {action} `{extension}` nie powiodło się: {e}", ephemeral=True)
+            return
+        
+        synced = await self.bot.sync_command_tree()
+        
+        embed = discord.Embed(
+            title=f"🔌 {action} `{extension}`",
+            description=f"Czas: **{elapsed_ms:.1f}ms**\n"
+                        + ("Komendy slash zsynchronizowane." if synced else "Komendy slash bez zmian."),
+            color=discord.Color.green()
+        )
+        await interaction.followup.send(embed=embed, ephemeral=True)
+    
+    async def extension_autocomplete(self, interaction: discord.Interaction, current: str):
+        names = sorted(set(EXTENSIONS) | set(self.bot.extensions))
+        return [app_commands.Choice(name=name, value=name) for name in names if current.lower() in name.lower()][:25]
+    
+    @app_commands.command(name="load", description="Ładuje rozszerzenie")
+    @app_commands.describe(extension="Nazwa modułu, np. cogs.legacy")
+    @app_commands.autocomplete(extension=extension_autocomplete)
+    async def load(self, interaction: discord.Interaction, extension: str):
+        """Load an extension on demand"""
+        await self._run(interaction, "load", extension)
+    
+    @app_commands.command(name="unload", description="Wyładowuje rozszerzenie")
+    @app_commands.describe(extension="Nazwa modułu, np. cogs.legacy")
+    @app_commands.autocomplete(extension=extension_autocomplete)
+    async def unload(self, interaction: discord.Interaction, extension: str):
+        """Unload an extension"""
+        await self._run(interaction, "unload", extension)
+    
+    @app_commands.command(name="reload", description="Przeładowuje rozszerzenie bez rozłączania bota")
+    @app_commands.describe(extension="Nazwa modułu, np. cogs.embeds")
+    @app_commands.autocomplete(extension=extension_autocomplete)
+    async def reload(self, interaction: discord.Interaction, extension: str):
+        """Hot-reload an extension without dropping the gateway session"""
+        await self._run(interaction, "reload", extension)
+    
+    @app_commands.command(name="list", description="Wyświetla rozszerzenia i czasy ich ładowania")
+    async def list_extensions(self, interaction: discord.Interaction):
+        """List configured and loaded extensions with their last load time"""
+        lines = []
+        for name in sorted(set(EXTENSIONS) | set(self.bot.extensions)):
+            if name in self.bot.extensions:
+                lines.append(f"🟢 `{name}` - {self.bot.extension_load_times.get(name, 0):.1f}ms")
+            else:
+                lines.append(f"⚪ `{name}` - nie załadowane")
+        
+        embed = discord.Embed(
+            title="🔌 Rozszerzenia",
+            description="\n".join(lines),
+            color=discord.Color.blue()
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(Admin(bot))
@@ -0,0 +1,179 @@
+import discord
+from discord.ext import commands
+from discord import app_commands
+import asyncio
+import cProfile
+import io
+import logging
+import threading
+import tracemalloc
+from helpers import ensure_owner
+from profiling import SamplingProfiler, SlowCallbackBuffer, format_cprofile, format_tracemalloc_diff, format_tasks
+
+log = logging.getLogger(__name__)
+
+class Debug(commands.GroupCog, group_name="debug", group_description="Diagnostyka wydajności bota (tylko właściciel)"):
+    """Owner-only runtime profiling: cProfile/sampling profiles, tracemalloc diffs and task dumps.
+
+    Nothing is hooked into the event loop until one of the commands turns it on.
+    """
+    
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.profiling = False
+        self.memory_baseline = None
+        self.saved_loop_state = None  # (debug flag, slow_callback_duration) before loop_debug enabled
+        self.slow_callbacks = SlowCallbackBuffer()
+        super().__init__()
+    
+    async def cog_unload(self):
+        # Leave the loop as we found it when the extension is unloaded or reloaded
+        self._restore_loop(asyncio.get_running_loop())
+        if self.memory_baseline is not None:
+            tracemalloc.stop()
+    
+    def _restore_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Undo loop_debug: restore the saved debug flag and slow-callback threshold"""
+        if self.saved_loop_state is None:
+            return
+        
+        debug, slow_callback_duration = self.saved_loop_state
+        loop.set_debug(debug)
+        loop.slow_callback_duration = slow_callback_duration
+        logging.getLogger("asyncio").removeHandler(self.slow_callbacks)
+        self.saved_loop_state = None
+    
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        return await ensure_owner(interaction)
+    
+    @staticmethod
+    def _report_file(text: str, filename: str) -> discord.File:
+        return discord.File(io.BytesIO(text.encode('utf-8')), filename=filename)
+    
+    @app_commands.command(name="profile", description="Profiluje pętlę zdarzeń przez podany czas")
+    @app_commands.describe(
+        mode="cprofile (dokładny, wolniejszy) lub sampling (próbkowanie stosu, niski narzut)",
+        seconds="Czas profilowania w sekundach",
+        top="Liczba funkcji w raporcie"
+    )
+    @app_commands.choices(mode=[
+        app_commands.Choice(name="sampling", value="sampling"),
+        app_commands.Choice(name="cprofile", value="cprofile")
+    ])
+    async def profile(
+        self,
+        interaction: discord.Interaction,
+        mode: str = "sampling",
+        seconds: app_commands.Range[int, 1, 120] = 10,
+        top: app_commands.Range[int, 5, 200] = 40
+    ):
+        """Profile the live event loop for a fixed time and return the top functions"""
+        if self.profiling:
+            await interaction.response.send_message("❌ Profilowanie już trwa!", ephemeral=True)
+            return
+        
+        self.profiling = True
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        log.info('Profiling started', extra={"command": "debug profile", "user": interaction.user.id})
+        
+        try:
+            if mode == "cprofile":
+                # Profiles the event loop thread, i.e. every handler that runs meanwhile
+                profiler = cProfile.Profile()
+                profiler.enable()
+                try:
+                    await asyncio.sleep(seconds)
+                finally:
+                    profiler.disable()
+                report = format_cprofile(profiler, top)
+            else:
+                sampler = SamplingProfiler(threading.get_ident())
+                sampler.start()
+                try:
+                    await asyncio.sleep(seconds)
+                finally:
+                    sampler.stop()
+                report = sampler.report(top)
+        finally:
+            self.profiling = False
+        
+        await interaction.followup.send(
+            f"📊 Profil `{mode}` z {seconds}s:",
+            file=self._report_file(report, f"profile_{mode}.txt"),
+            ephemeral=True
+        )
+    
+    @app_commands.command(name="memory", description="Migawki tracemalloc i różnice zużycia pamięci")
+    @app_commands.describe(
+        action="start - rozpocznij śledzenie i zapisz bazę, diff - porównaj z bazą, stop - zakończ śledzenie",
+        top="Liczba miejsc alokacji w raporcie"
+    )
+    @app_commands.choices(action=[
+        app_commands.Choice(name="start", value="start"),
+        app_commands.Choice(name="diff", value="diff"),
+        app_commands.Choice(name="stop", value="stop")
+    ])
+    async def memory(self, interaction: discord.Interaction, action: str, top: app_commands.Range[int, 5, 200] = 30):
+        """Take tracemalloc snapshots and diff them against a baseline"""
+        if action == "start":
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(10)
+            self.memory_baseline = tracemalloc.take_snapshot()
+            await interaction.response.send_message("🧠 Śledzenie pamięci włączone, zapisano migawkę bazową.", ephemeral=True)
+        
+        elif action == "diff":
+            if not tracemalloc.is_tracing() or self.memory_baseline is None:
+                await interaction.response.send_message("❌ Najpierw użyj `/debug memory start`!", ephemeral=True)
+                return
+            
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            snapshot = tracemalloc.take_snapshot()
+            # Filtering and comparing large snapshots is CPU-bound, keep it off the loop
+            report = await asyncio.to_thread(format_tracemalloc_diff, snapshot, self.memory_baseline, top)
+            current, peak = tracemalloc.get_traced_memory()
+            await interaction.followup.send(
+                f"🧠 Pamięć śledzona: {current / 1024 / 1024:.1f} MiB (szczyt {peak / 1024 / 1024:.1f} MiB)",
+                file=self._report_file(report, "memory_diff.txt"),
+                ephemeral=True
+            )
+        
+        else:
+            tracemalloc.stop()
+            self.memory_baseline = None
+            await interaction.response.send_message("🧠 Śledzenie pamięci wyłączone.", ephemeral=True)
+    
+    @app_commands.command(name="loop_debug", description="Włącza tryb debugowania pętli zdarzeń (ostrzeżenia o wolnych callbackach)")
+    @app_commands.describe(
+        enabled="Czy włączyć tryb debugowania",
+        slow_ms="Próg wolnego callbacku w milisekundach"
+    )
+    async def loop_debug(self, interaction: discord.Interaction, enabled: bool, slow_ms: app_commands.Range[int, 1, 10000] = 100):
+        """Toggle asyncio debug mode and collect its slow-callback warnings"""
+        loop = asyncio.get_running_loop()
+        
+        if enabled:
+            if self.saved_loop_state is None:
+                # Only the first enable saves state, so re-enabling with a new threshold still restores the original
+                self.saved_loop_state = (loop.get_debug(), loop.slow_callback_duration)
+            loop.slow_callback_duration = slow_ms / 1000
+            logging.getLogger("asyncio").addHandler(self.slow_callbacks)
+            loop.set_debug(True)
+            message = f"🐢 Tryb debugowania pętli włączony (próg {slow_ms}ms)."
+        else:
+            self._restore_loop(loop)
+            message = "🐢 Tryb debugowania pętli wyłączony."
+        
+        await interaction.response.send_message(message, ephemeral=True)
+    
+    @app_commands.command(name="tasks", description="Zrzut oczekujących zadań asyncio i wolnych callbacków")
+    async def tasks(self, interaction: discord.Interaction):
+        """Dump pending asyncio tasks and the slow callbacks seen in loop debug mode"""
+        report = format_tasks(asyncio.all_tasks(), self.slow_callbacks.records)
+        await interaction.response.send_message(
+            "📋 Zadania asyncio:",
+            file=self._report_file(report, "tasks.txt"),
+            ephemeral=True
+        )
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(Debug(bot))
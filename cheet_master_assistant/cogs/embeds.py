@@ -0,0 +1,253 @@
+import discord
+import logging
+from discord.ext import commands
+from discord import app_commands
+from helpers import get_color_from_string, check_user_permissions, heavy_command
+
+log = logging.getLogger(__name__)
+
+def clear_preconditions(interaction: discord.Interaction, channel: discord.TextChannel, amount: int = 10):
+    """Checks for /clear run before admission control; returns an error message or None"""
+    if not interaction.guild:
+        return "❌ Ta komenda działa tylko na serwerach!"
+    
+    # Check permissions
+    if not interaction.user.guild_permissions.manage_messages:
+        return "❌ Nie masz uprawnień do zarządzania wiadomościami!"
+    
+    # Check if bot has permissions
+    if not channel.permissions_for(interaction.guild.me).manage_messages:
+        return f"❌ Bot nie ma uprawnień do zarządzania wiadomościami w kanale {channel.mention}!"
+    
+    # Validate amount
+    if amount < 1 or amount > 100:
+        return "❌ Liczba wiadomości musi być między 1 a 100!"
+    
+    return None
+
+class Embeds(commands.Cog):
+    """Slash commands for posting embeds and browsing server emojis and stickers"""
+    
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+    
+    @app_commands.command(name="embed", description="Tworzy wiadomość embed z kolorowym paskiem")
+    @app_commands.describe(
+        title="Tytuł embed",
+        description="Opis embed (użyj \\n dla nowej linii)",
+        color="Kolor paska bocznego (red, green, blue, hex, itp.)",
+        channel="Kanał, na który zostanie wysłana wiadomość (domyślnie bieżący)",
+        field1_name="Nazwa pierwszego pola (opcjonalne)",
+        field1_value="Wartość pierwszego pola (opcjonalne)",
+        field2_name="Nazwa drugiego pola (opcjonalne)",
+        field2_value="Wartość drugiego pola (opcjonalne)",
+        field3_name="Nazwa trzeciego pola (opcjonalne)",
+        field3_value="Wartość trzeciego pola (opcjonalne)",
+        signature="Czy wyświetlić podpis (Wysłane przez...)?",
+        timestamp="Czy wyświetlić datę i czas?",
+        sticker="Nazwa naklejki serwera wysłanej razem z embedem (opcjonalne)"
+    )
+    @heavy_command("embed")
+    async def slash_embed(
+        self,
+        interaction: discord.Interaction,
+        title: str,
+        description: str = "",
+        color: str = "blue",
+        channel: discord.TextChannel = None,
+        field1_name: str = None,
+        field1_value: str = None,
+        field2_name: str = None,
+        field2_value: str = None,
+        field3_name: str = None,
+        field3_value: str = None,
+        signature: bool = True,
+        timestamp: bool = True,
+        sticker: str = None
+    ):
+        """Create an embed message with custom color and fields"""
+        # Set target channel
+        target_channel = channel if channel else interaction.channel
+        
+        if not isinstance(target_channel, discord.TextChannel):
+            await interaction.response.send_message("❌ Wybrany kanał nie jest kanałem tekstowym!", ephemeral=True)
+            return
+        
+        # Resolve the sticker through the per-guild index before responding
+        stickers = []
+        if sticker:
+            found = self.bot.sticker_index.find(interaction.guild, sticker) if interaction.guild else None
+            if found is None or not found.available:
+                await interaction.response.send_message(f"❌ Nie znaleziono naklejki `{sticker}` na tym serwerze! Użyj `/list_stickers`.", ephemeral=True)
+                return
+            stickers.append(found)
+
+        # Replace \n with actual newlines in description
+        processed_description = description.replace("\\n", "\n")
+
+        # Create embed
+        embed_color = get_color_from_string(color)
+        embed = discord.Embed(
+            title=title,
+            description=processed_description,
+            color=embed_color
+        )
+        
+        # Add fields if provided
+        fields = [
+            (field1_name, field1_value),
+            (field2_name, field2_value),
+            (field3_name, field3_value)
+        ]
+        
+        for field_name, field_value in fields:
+            if field_name and field_value:
+                # Process fields for newlines
+                processed_field_name = field_name.replace("\\n", "\n")
+                processed_field_value = field_value.replace("\\n", "\n")
+
+                embed.add_field(name=processed_field_name, value=processed_field_value, inline=True)
+        
+        # Add footer based on signature and timestamp options
+        if signature or timestamp:
+            footer_text = []
+            if signature:
+                footer_text.append(f"Wysłane przez {interaction.user.display_name}")
+            
+            embed.set_footer(
+                text=" | ".join(footer_text),
+                icon_url=interaction.user.avatar.url if interaction.user.avatar else None
+            )
+            if timestamp:
+                embed.timestamp = discord.utils.utcnow()
+        
+        # Send initial response to interaction (can be ephemeral)
+        await interaction.response.send_message(f"Wysyłam wiadomość embed na kanał {target_channel.mention}...", ephemeral=True)
+
+        # Send the actual embed to the target channel, with the sticker in the same message
+        await target_channel.send(embed=embed, stickers=stickers or None)
+    
+    @slash_embed.autocomplete("sticker")
+    async def sticker_autocomplete(self, interaction: discord.Interaction, current: str):
+        if not interaction.guild:
+            return []
+        
+        current = current.lower()
+        index = self.bot.sticker_index.get(interaction.guild)
+        return [app_commands.Choice(name=name, value=name) for name in index if current in name][:25]
+
+    @app_commands.command(name="list_emojis", description="Pokazuje listę dostępnych emotek na serwerze")
+    @heavy_command("list_emojis")
+    async def slash_list_emojis(self, interaction: discord.Interaction):
+        """List all custom emojis available on the server"""
+        if not interaction.guild:
+            await interaction.response.send_message("❌ Ta komenda działa tylko na serwerach!", ephemeral=True)
+            return
+        
+        if not interaction.guild.emojis:
+            await interaction.response.send_message("❌ Ten serwer nie ma żadnych niestandardowych emotek!", ephemeral=True)
+            return
+        
+        embed = discord.Embed(
+            title=f"Emotki serwera {interaction.guild.name}",
+            description="Lista dostępnych niestandardowych emotek:",
+            color=discord.Color.green()
+        )
+        
+        emoji_list = []
+        for emoji in interaction.guild.emojis:
+            emoji_list.append(f"{emoji} `:{emoji.name}:`")
+        
+        # Split into chunks if too many emojis
+        chunk_size = 20
+        for i in range(0, len(emoji_list), chunk_size):
+            chunk = emoji_list[i:i+chunk_size]
+            embed.add_field(
+                name=f"Emotki ({i+1}-{min(i+chunk_size, len(emoji_list))})",
+                value="\n".join(chunk),
+                inline=False
+            )
+        
+        await interaction.response.send_message(embed=embed)
+
+    @app_commands.command(name="list_stickers", description="Pokazuje listę naklejek serwera, których można użyć w /embed")
+    async def slash_list_stickers(self, interaction: discord.Interaction):
+        """List all guild stickers that can be attached to embeds"""
+        if not check_user_permissions(interaction):
+            await interaction.response.send_message("❌ Nie masz uprawnień do używania komend tego bota!", ephemeral=True)
+            return
+        
+        if not interaction.guild:
+            await interaction.response.send_message("❌ Ta komenda działa tylko na serwerach!", ephemeral=True)
+            return
+        
+        index = self.bot.sticker_index.get(interaction.guild)
+        if not index:
+            await interaction.response.send_message("❌ Ten serwer nie ma żadnych niestandardowych naklejek!", ephemeral=True)
+            return
+        
+        embed = discord.Embed(
+            title=f"Naklejki serwera {interaction.guild.name}",
+            description="Użyj nazwy w opcji `sticker` komendy `/embed` albo jako `:nazwa:` w `!embed_with_stickers`:",
+            color=discord.Color.purple()
+        )
+        
+        sticker_list = []
+        for sticker in index.values():
+            sticker_list.append(f"`:{sticker.name}:` - {sticker.description or 'Brak opisu'}")
+        
+        # Split into chunks if too many stickers
+        chunk_size = 15
+        for i in range(0, len(sticker_list), chunk_size):
+            chunk = sticker_list[i:i+chunk_size]
+            embed.add_field(
+                name=f"Naklejki ({i+1}-{min(i+chunk_size, len(sticker_list))})",
+                value="\n".join(chunk),
+                inline=False
+            )
+        
+        await interaction.response.send_message(embed=embed)
+
+    @app_commands.command(name="clear", description="Czyści wiadomości z kanału")
+    @app_commands.describe(
+        channel="Kanał, z którego mają zostać usunięte wiadomości",
+        amount="Liczba wiadomości do usunięcia (1-100, domyślnie 10)"
+    )
+    @heavy_command("clear", check=clear_preconditions)
+    async def slash_clear(
+        self,
+        interaction: discord.Interaction,
+        channel: discord.TextChannel,
+        amount: int = 10
+    ):
+        """Clear messages from a channel (permissions and amount are checked in clear_preconditions)"""
+        # Send initial response
+        await interaction.response.send_message(f"🧹 Czyszczę {amount} wiadomości z kanału {channel.mention}...", ephemeral=True)
+        
+        try:
+            # Delete messages
+            deleted = await channel.purge(limit=amount)
+            
+            # Send confirmation
+            embed = discord.Embed(
+                title="🧹 Wiadomości usunięte",
+                description=f"Usunięto **{len(deleted)}** wiadomości z kanału {channel.mention}",
+                color=discord.Color.green()
+            )
+            embed.set_footer(
+                text=f"Wykonane przez {interaction.user.display_name}",
+                icon_url=interaction.user.avatar.url if interaction.user.avatar else None
+            )
+            embed.timestamp = discord.utils.utcnow()
+            
+            # Send confirmation to the channel where command was used
+            await interaction.followup.send(embed=embed, ephemeral=True)
+            
+        except discord.Forbidden:
+            await interaction.followup.send("❌ Bot nie ma uprawnień do usuwania wiadomości w tym kanale!", ephemeral=True)
+        except discord.HTTPException as e:
+            log.warning('Purge failed', extra={"guild": interaction.guild_id, "command": "clear", "error": repr(e)})
+            await interaction.followup.send(f"❌ Wystąpił błąd podczas usuwania wiadomości: {e}", ephemeral=True)
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(Embeds(bot))
@@ -0,0 +1,70 @@
+import discord
+from discord.ext import commands
+from discord import app_commands
+from helpers import check_user_permissions
+
+class General(commands.Cog):
+    """Basic slash commands: ping and help"""
+    
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+    
+    @app_commands.command(name="ping", description="Sprawdza opóźnienie bota")
+    async def slash_ping(self, interaction: discord.Interaction):
+        """Slash command version of ping"""
+        if not check_user_permissions(interaction):
+            await interaction.response.send_message("❌ Nie masz uprawnień do używania komend tego bota!", ephemeral=True)
+            return
+        
+        latency = round(self.bot.latency * 1000)
+        await interaction.response.send_message(f'🏓 Pong! Latency: {latency}ms')
+
+    @app_commands.command(name="help", description="Pokazuje pomoc dla bota")
+    async def slash_help(self, interaction: discord.Interaction):
+        """Slash command version of help"""
+        if not check_user_permissions(interaction):
+            await interaction.response.send_message("❌ Nie masz uprawnień do używania komend tego bota!", ephemeral=True)
+            return
+        
+        embed = discord.Embed(
+            title="🤖 Cheet Master Assistant - Pomoc",
+            description="Bot do wysyłania wiadomości Embed z obsługą serwerowych naklejek i emotek",
+            color=discord.Color.blue()
+        )
+        
+        embed.add_field(
+            name="📝 Komendy slash:",
+            value="`/ping` - Sprawdza opóźnienie bota\n"
+                  "`/help` - Pokazuje tę pomoc\n"
+                  "`/embed` - Tworzy wiadomość embed\n"
+                  "`/list_emojis` - Lista emotek serwera\n"
+                  "`/list_stickers` - Lista naklejek serwera\n"
+                  "`/clear` - Czyści wiadomości z kanału\n"
+                  "`/settings` - Zarządzanie uprawnieniami ról (tylko admin)\n"
+                  "`/settings add_roles` / `remove_roles` - Wiele ról naraz\n"
+                  "`/settings export` / `import` - Kopia ustawień serwera (JSON)\n"
+                  "`/settings set_cooldown` / `set_concurrency` / `cooldowns` - Limity komend",
+            inline=False
+        )
+        
+        embed.add_field(
+            name="🎨 Dostępne kolory:",
+            value="red, green, blue, yellow, orange, purple, magenta, gold, black, white\n"
+                  "dark_red, dark_green, dark_blue, dark_purple, dark_magenta, dark_gold\n"
+                  "Lub hex: #FF0000, #00FF00, itp.",
+            inline=False
+        )
+        
+        embed.add_field(
+            name="😀 Emotki i naklejki:",
+            value="Użyj `:nazwa:` w treści wiadomości (np. `:psc:`, `:blik:`)\n"
+                  "Bot automatycznie znajdzie i użyje emotek/naklejek z serwera\n"
+                  "Naklejkę do `/embed` wybierz w opcji `sticker`",
+            inline=False
+        )
+        
+        embed.set_footer(text="Cheet Master Assistant v2.1 | Slash Commands + Role Permissions")
+        await interaction.response.send_message(embed=embed)
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(General(bot))
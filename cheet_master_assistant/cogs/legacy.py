@@ -0,0 +1,240 @@
+import discord
+from discord.ext import commands
+from helpers import get_color_from_string, parse_custom_emojis, extract_stickers, heavy_command
+
+class Legacy(commands.Cog):
+    """Legacy prefix commands (for backward compatibility)"""
+    
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+    
+    @commands.command(name='ping')
+    async def ping(self, ctx):
+        """Test command to check if bot is responsive"""
+        await ctx.send(f'🏓 Pong! Latency: {round(self.bot.latency * 1000)}ms')
+
+    @commands.command(name='help_embed')
+    async def help_embed(self, ctx):
+        """Show help for embed commands"""
+        embed = discord.Embed(
+            title="🤖 Cheet Master Assistant - Pomoc",
+            description="Bot do wysyłania wiadomości Embed z obsługą serwerowych naklejek i emotek",
+            color=discord.Color.blue()
+        )
+        
+        embed.add_field(
+            name="📝 Komendy slash (zalecane):",
+            value="`/ping` - Sprawdza opóźnienie bota\n"
+                  "`/help` - Pokazuje pomoc\n"
+                  "`/embed` - Tworzy wiadomość embed\n"
+                  "`/list_emojis` - Lista emotek serwera\n"
+                  "`/list_stickers` - Lista naklejek serwera",
+            inline=False
+        )
+        
+        embed.add_field(
+            name="📝 Stare komendy (nadal działają):",
+            value="`!ping` - Sprawdza opóźnienie bota\n"
+                  "`!help_embed` - Pokazuje tę pomoc\n"
+                  "`!embed` - Podstawowy embed\n"
+                  "`!embed_with_stickers` - Embed z emotkami/naklejkami",
+            inline=False
+        )
+        
+        embed.add_field(
+            name="🎨 Dostępne kolory:",
+            value="red, green, blue, yellow, orange, purple, magenta, gold, black, white\n"
+                  "dark_red, dark_green, dark_blue, dark_purple, dark_magenta, dark_gold\n"
+                  "Lub hex: #FF0000, #00FF00, itp.",
+            inline=False
+        )
+        
+        embed.set_footer(text="Cheet Master Assistant v2.1 | Slash Commands + Role Permissions")
+        await ctx.send(embed=embed)
+
+    @commands.command(name='embed')
+    async def send_embed(self, ctx, *, content=None):
+        """Legacy embed command"""
+        if not content:
+            await ctx.send("❌ Podaj treść dla embed! Użyj: `!embed [tytuł] | [opis] | [kolor] | [pola]`\n"
+                          "💡 **Tip:** Użyj nowej komendy `/embed` dla lepszego doświadczenia!")
+            return
+        
+        # Parse the content
+        parts = content.split('|')
+        
+        # Default values
+        title = "Cheet Master Assistant"
+        description = ""
+        color = discord.Color.blue()
+        fields = []
+        
+        # Parse title
+        if len(parts) >= 1 and parts[0].strip():
+            title = parts[0].strip()
+        
+        # Parse description
+        if len(parts) >= 2 and parts[1].strip():
+            description = parts[1].strip()
+        
+        # Parse color
+        if len(parts) >= 3 and parts[2].strip():
+            color = get_color_from_string(parts[2].strip())
+        
+        # Parse fields
+        if len(parts) >= 4 and parts[3].strip():
+            field_pairs = parts[3].strip().split(',')
+            for pair in field_pairs:
+                if ':' in pair:
+                    field_name, field_value = pair.split(':', 1)
+                    fields.append((field_name.strip(), field_value.strip()))
+        
+        # Create embed
+        embed = discord.Embed(
+            title=title,
+            description=description,
+            color=color
+        )
+        
+        # Add fields
+        for field_name, field_value in fields:
+            embed.add_field(name=field_name, value=field_value, inline=True)
+        
+        # Add footer
+        embed.set_footer(text=f"Wysłane przez {ctx.author.display_name}", icon_url=ctx.author.avatar.url if ctx.author.avatar else None)
+        embed.timestamp = discord.utils.utcnow()
+        
+        await ctx.send(embed=embed)
+
+    @commands.command(name='embed_with_stickers')
+    @heavy_command("embed_with_stickers")
+    async def send_embed_with_stickers(self, ctx, *, content=None):
+        """Legacy embed command with stickers support"""
+        if not content:
+            await ctx.send("❌ Podaj treść dla embed! Użyj: `!embed_with_stickers [tytuł] | [opis] | [kolor] | [pola]`\n"
+                          "💡 **Tip:** Użyj nowej komendy `/embed` dla lepszego doświadczenia!")
+            return
+        
+        # Parse the content for custom emojis and stickers
+        parsed_content = parse_custom_emojis(content, ctx.guild, self.bot.emoji_index)
+        parsed_content, stickers = extract_stickers(parsed_content, ctx.guild, self.bot.sticker_index)
+        
+        # Parse the embed content (same as regular embed command)
+        parts = parsed_content.split('|')
+        
+        # Default values
+        title = "Cheet Master Assistant"
+        description = ""
+        color = discord.Color.blue()
+        fields = []
+        
+        # Parse title
+        if len(parts) >= 1 and parts[0].strip():
+            title = parts[0].strip()
+        
+        # Parse description
+        if len(parts) >= 2 and parts[1].strip():
+            description = parts[1].strip()
+        
+        # Parse color
+        if len(parts) >= 3 and parts[2].strip():
+            color = get_color_from_string(parts[2].strip())
+        
+        # Parse fields
+        if len(parts) >= 4 and parts[3].strip():
+            field_pairs = parts[3].strip().split(',')
+            for pair in field_pairs:
+                if ':' in pair:
+                    field_name, field_value = pair.split(':', 1)
+                    fields.append((field_name.strip(), field_value.strip()))
+        
+        # Create embed
+        embed = discord.Embed(
+            title=title,
+            description=description,
+            color=color
+        )
+        
+        # Add fields
+        for field_name, field_value in fields:
+            embed.add_field(name=field_name, value=field_value, inline=True)
+        
+        # Add footer
+        embed.set_footer(text=f"Wysłane przez {ctx.author.display_name}", icon_url=ctx.author.avatar.url if ctx.author.avatar else None)
+        embed.timestamp = discord.utils.utcnow()
+        
+        # Send embed together with any stickers in one message
+        await ctx.send(embed=embed, stickers=stickers or None)
+
+    @commands.command(name='list_emojis')
+    async def list_server_emojis(self, ctx):
+        """Legacy command to list server emojis"""
+        await ctx.send("💡 **Tip:** Użyj nowej komendy `/list_emojis` dla lepszego doświadczenia!")
+        
+        if not ctx.guild:
+            await ctx.send("❌ Ta komenda działa tylko na serwerach!")
+            return
+        
+        if not ctx.guild.emojis:
+            await ctx.send("❌ Ten serwer nie ma żadnych niestandardowych emotek!")
+            return
+        
+        embed = discord.Embed(
+            title=f"Emotki serwera {ctx.guild.name}",
+            description="Lista dostępnych niestandardowych emotek:",
+            color=discord.Color.green()
+        )
+        
+        emoji_list = []
+        for emoji in ctx.guild.emojis:
+            emoji_list.append(f"{emoji} `:{emoji.name}:`")
+        
+        # Split into chunks if too many emojis
+        chunk_size = 20
+        for i in range(0, len(emoji_list), chunk_size):
+            chunk = emoji_list[i:i+chunk_size]
+            embed.add_field(
+                name=f"Emotki ({i+1}-{min(i+chunk_size, len(emoji_list))})",
+                value="\n".join(chunk),
+                inline=False
+            )
+        
+        await ctx.send(embed=embed)
+
+    @commands.command(name='list_stickers')
+    async def list_server_stickers(self, ctx):
+        """Legacy command to list server stickers"""
+        await ctx.send("💡 **Tip:** Użyj nowej komendy `/list_stickers` dla lepszego doświadczenia!")
+        
+        if not ctx.guild:
+            await ctx.send("❌ Ta komenda działa tylko na serwerach!")
+            return
+        
+        if not ctx.guild.stickers:
+            await ctx.send("❌ Ten serwer nie ma żadnych niestandardowych naklejek!")
+            return
+        
+        embed = discord.Embed(
+            title=f"Naklejki serwera {ctx.guild.name}",
+            description="Lista dostępnych niestandardowych naklejek:",
+            color=discord.Color.purple()
+        )
+        
+        sticker_list = []
+        for sticker in ctx.guild.stickers:
+            sticker_list.append(f"`:{sticker.name}:` - {sticker.description or 'Brak opisu'}")
+        
+        # Split into chunks if too many stickers
+        chunk_size = 15
+        for i in range(0, len(sticker_list), chunk_size):
+            chunk = sticker_list[i:i+chunk_size]
+            embed.add_field(
+                name=f"Naklejki ({i+1}-{min(i+chunk_size, len(sticker_list))})",
+                value="\n".join(chunk),
+                inline=False
+            )
+        
+        await ctx.send(embed=embed)
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(Legacy(bot))
@@ -0,0 +1,396 @@
+import discord
+from discord.ext import commands
+from discord import app_commands
+import io
+import json
+from config import COOLDOWN_DEFAULTS, COOLDOWN_MAX_REQUESTS, COOLDOWN_MAX_PER_SECONDS, MAX_CONCURRENT_HEAVY
+from helpers import check_admin_permissions
+
+class RoleBatchSelect(discord.ui.RoleSelect):
+    """Role select menu that adds or removes many roles in one settings transaction"""
+    
+    def __init__(self, adding: bool):
+        super().__init__(
+            placeholder="Wybierz role (maksymalnie 25)",
+            min_values=1,
+            max_values=25
+        )
+        self.adding = adding
+    
+    async def callback(self, interaction: discord.Interaction):
+        role_ids = [role.id for role in self.values]
+        
+        if self.adding:
+            changed_ids = interaction.client.settings_manager.add_allowed_roles(interaction.guild.id, role_ids)
+            title = "✅ Role dodane"
+            changed_text = "Dodane do listy dozwolonych ról"
+            skipped_text = "Już były na liście"
+        else:
+            changed_ids = interaction.client.settings_manager.remove_allowed_roles(interaction.guild.id, role_ids)
+            title = "✅ Role usunięte"
+            changed_text = "Usunięte z listy dozwolonych ról"
+            skipped_text = "Nie było ich na liście"
+        
+        changed = [role.mention for role in self.values if role.id in changed_ids]
+        skipped = [role.mention for role in self.values if role.id not in changed_ids]
+        
+        embed = discord.Embed(
+            title=title,
+            color=discord.Color.green() if changed else discord.Color.orange()
+        )
+        embed.add_field(name=changed_text, value="\n".join(changed) or "Brak", inline=False)
+        if skipped:
+            embed.add_field(name=skipped_text, value="\n".join(skipped), inline=False)
+        
+        embed.set_footer(
+            text=f"Wykonane przez {interaction.user.display_name}",
+            icon_url=interaction.user.avatar.url if interaction.user.avatar else None
+        )
+        
+        await interaction.response.edit_message(content=None, embed=embed, view=None)
+
+class RoleBatchView(discord.ui.View):
+    """Ephemeral view wrapping RoleBatchSelect"""
+    
+    def __init__(self, adding: bool):
+        super().__init__(timeout=120)
+        self.add_item(RoleBatchSelect(adding))
+
+class SettingsGroup(commands.GroupCog, group_name="settings", group_description="Zarządzanie ustawieniami bota"):
+    """Settings command group for managing role permissions"""
+    
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        super().__init__()
+    
+    @app_commands.command(name="add_role", description="Dodaje rolę do listy dozwolonych ról")
+    @app_commands.describe(role="Rola, która ma otrzymać dostęp do komend bota")
+    async def add_role(self, interaction: discord.Interaction, role: discord.Role):
+        """Add a role to the allowed roles list"""
+        if not check_admin_permissions(interaction):
+            await interaction.response.send_message("❌ Nie masz uprawnień do zarządzania ustawieniami bota! Wymagane: Zarządzanie rolami lub Administrator.", ephemeral=True)
+            return
+        
+        if not interaction.guild:
+            await interaction.response.send_message("❌ Ta komenda działa tylko na serwerach!", ephemeral=True)
+            return
+        
+        success = self.bot.settings_manager.add_allowed_role(interaction.guild.id, role.id)
+        
+        if success:
+            embed = discord.Embed(
+                title="✅ Rola dodana",
+                description=f"Rola {role.mention} została dodana do listy dozwolonych ról.",
+                color=discord.Color.green()
+            )
+        else:
+            embed = discord.Embed(
+                title="⚠️ Rola już istnieje",
+                description=f"Rola {role.mention} już znajduje się na liście dozwolonych ról.",
+                color=discord.Color.orange()
+            )
+        
+        embed.set_footer(
+            text=f"Wykonane przez {interaction.user.display_name}",
+            icon_url=interaction.user.avatar.url if interaction.user.avatar else None
+        )
+        
+        await interaction.response.send_message(embed=embed)
+    
+    @app_commands.command(name="remove_role", description="Usuwa rolę z listy dozwolonych ról")
+    @app_commands.describe(role="Rola, która ma zostać usunięta z listy dozwolonych")
+    async def remove_role(self, interaction: discord.Interaction, role: discord.Role):
+        """Remove a role from the allowed roles list"""
+        if not check_admin_permissions(interaction):
+            await interaction.response.send_message("❌ Nie masz uprawnień do zarządzania ustawieniami bota! Wymagane: Zarządzanie rolami lub Administrator.", ephemeral=True)
+            return
+        
+        if not interaction.guild:
+            await interaction.response.send_message("❌ Ta komenda działa tylko na serwerach!", ephemeral=True)
+            return
+        
+        success = self.bot.settings_manager.remove_allowed_role(interaction.guild.id, role.id)
+        
+        if success:
+            embed = discord.Embed(
+                title="✅ Rola usunięta",
+                description=f"Rola {role.mention} została usunięta z listy dozwolonych ról.",
+                color=discord.Color.green()
+            )
+        else:
+            embed = discord.Embed(
+                title="❌ Rola nie znaleziona",
+                description=f"Rola {role.mention} nie znajduje się na liście dozwolonych ról.",
+                color=discord.Color.red()
+            )
+        
+        embed.set_footer(
+            text=f"Wykonane przez {interaction.user.display_name}",
+            icon_url=interaction.user.avatar.url if interaction.user.avatar else None
+        )
+        
+        await interaction.response.send_message(embed=embed)
+    
+    @app_commands.command(name="add_roles", description="Dodaje wiele ról naraz do listy dozwolonych ról")
+    async def add_roles(self, interaction: discord.Interaction):
+        """Add many roles to the allowed roles list using a role select menu"""
+        if not check_admin_permissions(interaction):
+            await interaction.response.send_message("❌ Nie masz uprawnień do zarządzania ustawieniami bota! Wymagane: Zarządzanie rolami lub Administrator.", ephemeral=True)
+            return
+        
+        if not interaction.guild:
+            await interaction.response.send_message("❌ Ta komenda działa tylko na serwerach!", ephemeral=True)
+            return
+        
+        await interaction.response.send_message("Wybierz role, które mają otrzymać dostęp do komend bota:", view=RoleBatchView(adding=True), ephemeral=True)
+    
+    @app_commands.command(name="remove_roles", description="Usuwa wiele ról naraz z listy dozwolonych ról")
+    async def remove_roles(self, interaction: discord.Interaction):
+        """Remove many roles from the allowed roles list using a role select menu"""
+        if not check_admin_permissions(interaction):
+            await interaction.response.send_message("❌ Nie masz uprawnień do zarządzania ustawieniami bota! Wymagane: Zarządzanie rolami lub Administrator.", ephemeral=True)
+            return
+        
+        if not interaction.guild:
+            await interaction.response.send_message("❌ Ta komenda działa tylko na serwerach!", ephemeral=True)
+            return
+        
+        await interaction.response.send_message("Wybierz role, które mają zostać usunięte z listy dozwolonych:", view=RoleBatchView(adding=False), ephemeral=True)
+    
+    @app_commands.command(name="list_roles", description="Wyświetla listę dozwolonych ról")
+    async def list_roles(self, interaction: discord.Interaction):
+        """List all allowed roles for the current guild"""
+        if not check_admin_permissions(interaction):
+            await interaction.response.send_message("❌ Nie masz uprawnień do zarządzania ustawieniami bota! Wymagane: Zarządzanie rolami lub Administrator.", ephemeral=True)
+            return
+        
+        if not interaction.guild:
+            await interaction.response.send_message("❌ Ta komenda działa tylko na serwerach!", ephemeral=True)
+            return
+        
+        allowed_role_ids = self.bot.settings_manager.get_allowed_roles(interaction.guild.id)
+        
+        embed = discord.Embed(
+            title="🔒 Dozwolone role",
+            color=discord.Color.blue()
+        )
+        
+        if not allowed_role_ids:
+            embed.description = "**Brak ograniczeń** - wszyscy użytkownicy mogą używać komend bota.\n\nAby ograniczyć dostęp, użyj `/settings add_role <rola>`."
+        else:
+            role_mentions = []
+            for role_id in allowed_role_ids:
+                role = interaction.guild.get_role(role_id)
+                if role:
+                    role_mentions.append(role.mention)
+                else:
+                    role_mentions.append(f"<@&{role_id}> (rola usunięta)")
+            
+            embed.description = f"Tylko użytkownicy z następującymi rolami mogą używać komend bota:\n\n" + "\n".join(role_mentions)
+        
+        embed.set_footer(
+            text=f"Serwer: {interaction.guild.name}",
+            icon_url=interaction.guild.icon.url if interaction.guild.icon else None
+        )
+        
+        await interaction.response.send_message(embed=embed)
+    
+    @app_commands.command(name="reset", description="Resetuje ustawienia ról (usuwa wszystkie ograniczenia)")
+    async def reset_roles(self, interaction: discord.Interaction):
+        """Reset role settings for the current guild"""
+        if not check_admin_permissions(interaction):
+            await interaction.response.send_message("❌ Nie masz uprawnień do zarządzania ustawieniami bota! Wymagane: Zarządzanie rolami lub Administrator.", ephemeral=True)
+            return
+        
+        if not interaction.guild:
+            await interaction.response.send_message("❌ Ta komenda działa tylko na serwerach!", ephemeral=True)
+            return
+        
+        success = self.bot.settings_manager.clear_guild_settings(interaction.guild.id)
+        
+        embed = discord.Embed(
+            title="🔄 Ustawienia zresetowane",
+            description="Wszystkie ograniczenia ról zostały usunięte. Wszyscy użytkownicy mogą teraz używać komend bota.",
+            color=discord.Color.green()
+        )
+        
+        embed.set_footer(
+            text=f"Wykonane przez {interaction.user.display_name}",
+            icon_url=interaction.user.avatar.url if interaction.user.avatar else None
+        )
+        
+        await interaction.response.send_message(embed=embed)
+    
+    @app_commands.command(name="set_cooldown", description="Ustawia limit użycia ciężkiej komendy na tym serwerze")
+    @app_commands.describe(
+        command="Komenda, której dotyczy limit",
+        scope="Limit na użytkownika czy na cały serwer",
+        requests="Liczba użyć w oknie czasowym (0 przywraca domyślny limit)",
+        per_seconds="Długość okna czasowego w sekundach"
+    )
+    @app_commands.choices(
+        command=[app_commands.Choice(name=name, value=name) for name in COOLDOWN_DEFAULTS],
+        scope=[
+            app_commands.Choice(name="użytkownik", value="user"),
+            app_commands.Choice(name="serwer", value="guild")
+        ]
+    )
+    async def set_cooldown(
+        self,
+        interaction: discord.Interaction,
+        command: str,
+        scope: str,
+        requests: app_commands.Range[int, 0, COOLDOWN_MAX_REQUESTS],
+        per_seconds: app_commands.Range[int, 1, COOLDOWN_MAX_PER_SECONDS] = 60
+    ):
+        """Override the token bucket cooldown of a heavy command for this guild"""
+        if not check_admin_permissions(interaction):
+            await interaction.response.send_message("❌ Nie masz uprawnień do zarządzania ustawieniami bota! Wymagane: Zarządzanie rolami lub Administrator.", ephemeral=True)
+            return
+        
+        if not interaction.guild:
+            await interaction.response.send_message("❌ Ta komenda działa tylko na serwerach!", ephemeral=True)
+            return
+        
+        if requests == 0:
+            self.bot.settings_manager.set_cooldown(interaction.guild.id, command, scope, None)
+            requests, per_seconds = COOLDOWN_DEFAULTS[command][scope]
+            description = f"Przywrócono domyślny limit `/{command}`: **{requests}** użyć na **{per_seconds}s**."
+        else:
+            self.bot.settings_manager.set_cooldown(interaction.guild.id, command, scope, requests, per_seconds)
+            description = f"Limit `/{command}`: **{requests}** użyć na **{per_seconds}s**."
+        
+        embed = discord.Embed(
+            title="⏳ Limit zaktualizowany",
+            description=description + (" (na użytkownika)" if scope == "user" else " (na serwer)"),
+            color=discord.Color.green()
+        )
+        
+        embed.set_footer(
+            text=f"Wykonane przez {interaction.user.display_name}",
+            icon_url=interaction.user.avatar.url if interaction.user.avatar else None
+        )
+        
+        await interaction.response.send_message(embed=embed)
+    
+    @app_commands.command(name="set_concurrency", description="Ustawia limit równoczesnych ciężkich komend na tym serwerze")
+    @app_commands.describe(limit=f"Maksymalna liczba równoczesnych komend (0 usuwa limit serwera, globalny limit to {MAX_CONCURRENT_HEAVY})")
+    async def set_concurrency(self, interaction: discord.Interaction, limit: app_commands.Range[int, 0, MAX_CONCURRENT_HEAVY]):
+        """Set the per-guild cap on heavy commands in flight"""
+        if not check_admin_permissions(interaction):
+            await interaction.response.send_message("❌ Nie masz uprawnień do zarządzania ustawieniami bota! Wymagane: Zarządzanie rolami lub Administrator.", ephemeral=True)
+            return
+        
+        if not interaction.guild:
+            await interaction.response.send_message("❌ Ta komenda działa tylko na serwerach!", ephemeral=True)
+            return
+        
+        self.bot.settings_manager.set_max_concurrency(interaction.guild.id, limit or None)
+        
+        embed = discord.Embed(
+            title="⏳ Limit równoczesności zaktualizowany",
+            description=(f"Na tym serwerze może działać naraz maksymalnie **{limit}** ciężkich komend." if limit
+                         else f"Usunięto limit serwera; obowiązuje limit globalny (**{MAX_CONCURRENT_HEAVY}**)."),
+            color=discord.Color.green()
+        )
+        
+        embed.set_footer(
+            text=f"Wykonane przez {interaction.user.display_name}",
+            icon_url=interaction.user.avatar.url if interaction.user.avatar else None
+        )
+        
+        await interaction.response.send_message(embed=embed)
+    
+    @app_commands.command(name="cooldowns", description="Wyświetla limity użycia ciężkich komend")
+    async def list_cooldowns(self, interaction: discord.Interaction):
+        """List effective cooldowns and the concurrency cap for the current guild"""
+        if not check_admin_permissions(interaction):
+            await interaction.response.send_message("❌ Nie masz uprawnień do zarządzania ustawieniami bota! Wymagane: Zarządzanie rolami lub Administrator.", ephemeral=True)
+            return
+        
+        if not interaction.guild:
+            await interaction.response.send_message("❌ Ta komenda działa tylko na serwerach!", ephemeral=True)
+            return
+        
+        guild_cooldowns = self.bot.settings_manager.get_guild_cooldowns(interaction.guild.id)
+        guild_limit = self.bot.settings_manager.get_max_concurrency(interaction.guild.id)
+        
+        embed = discord.Embed(
+            title="⏳ Limity komend",
+            description=f"Równoczesne ciężkie komendy: **{guild_limit or MAX_CONCURRENT_HEAVY}**"
+                        + ("" if guild_limit else " (limit globalny)"),
+            color=discord.Color.blue()
+        )
+        
+        for command, defaults in COOLDOWN_DEFAULTS.items():
+            lines = []
+            for scope, label in (("user", "Użytkownik"), ("guild", "Serwer")):
+                override = guild_cooldowns.get(command, {}).get(scope)
+                requests, per_seconds = override or defaults[scope]
+                lines.append(f"{label}: {requests}/{per_seconds}s" + ("" if override else " (domyślnie)"))
+            embed.add_field(name=command, value="\n".join(lines), inline=True)
+        
+        embed.set_footer(
+            text=f"Serwer: {interaction.guild.name}",
+            icon_url=interaction.guild.icon.url if interaction.guild.icon else None
+        )
+        
+        await interaction.response.send_message(embed=embed)
+    
+    @app_commands.command(name="export", description="Eksportuje ustawienia serwera do pliku JSON")
+    async def export_settings(self, interaction: discord.Interaction):
+        """Export the current guild configuration as a JSON attachment"""
+        if not check_admin_permissions(interaction):
+            await interaction.response.send_message("❌ Nie masz uprawnień do zarządzania ustawieniami bota! Wymagane: Zarządzanie rolami lub Administrator.", ephemeral=True)
+            return
+        
+        if not interaction.guild:
+            await interaction.response.send_message("❌ Ta komenda działa tylko na serwerach!", ephemeral=True)
+            return
+        
+        data = self.bot.settings_manager.export_guild_settings(interaction.guild.id)
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        file = discord.File(io.BytesIO(payload), filename=f"settings_{interaction.guild.id}.json")
+        
+        await interaction.response.send_message("📦 Ustawienia serwera:", file=file, ephemeral=True)
+    
+    @app_commands.command(name="import", description="Importuje ustawienia serwera z pliku JSON")
+    @app_commands.describe(file="Plik JSON wyeksportowany komendą /settings export")
+    async def import_settings(self, interaction: discord.Interaction, file: discord.Attachment):
+        """Replace the current guild configuration with one from a JSON attachment"""
+        if not check_admin_permissions(interaction):
+            await interaction.response.send_message("❌ Nie masz uprawnień do zarządzania ustawieniami bota! Wymagane: Zarządzanie rolami lub Administrator.", ephemeral=True)
+            return
+        
+        if not interaction.guild:
+            await interaction.response.send_message("❌ Ta komenda działa tylko na serwerach!", ephemeral=True)
+            return
+        
+        if file.size > 64 * 1024:
+            await interaction.response.send_message("❌ Plik ustawień jest za duży!", ephemeral=True)
+            return
+        
+        try:
+            data = json.loads(await file.read())
+            known_role_ids = {role.id for role in interaction.guild.roles}
+            imported = self.bot.settings_manager.import_guild_settings(interaction.guild.id, data, known_role_ids)
+        except (ValueError, discord.HTTPException) as e:
+            # json.JSONDecodeError and UnicodeDecodeError are ValueError subclasses
+            await interaction.response.send_message(f"❌ Nie udało się zaimportować ustawień: {e}", ephemeral=True)
+            return
+        
+        embed = discord.Embed(
+            title="📥 Ustawienia zaimportowane",
+            description=f"Zaimportowano **{len(imported['allowed_roles'])}** dozwolonych ról.",
+            color=discord.Color.green()
+        )
+        
+        embed.set_footer(
+            text=f"Wykonane przez {interaction.user.display_name}",
+            icon_url=interaction.user.avatar.url if interaction.user.avatar else None
+        )
+        
+        await interaction.response.send_message(embed=embed)
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(SettingsGroup(bot))
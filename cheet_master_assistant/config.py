@@ -1,2 +1,44 @@
 TOKEN = 'Your Discord Bot TOKEN'
 
+# Derived caches restored on startup (see snapshot.py)
+SNAPSHOT_FILE = 'warm_snapshot.bin'
+
+# Admission control for heavy commands, as [requests, per seconds] token buckets.
+# Admins can override these per guild with /settings set_cooldown.
+COOLDOWN_DEFAULTS = {
+    "embed": {"user": [3, 30], "guild": [20, 60]},
+    "clear": {"user": [2, 30], "guild": [5, 60]},
+    "list_emojis": {"user": [2, 30], "guild": [10, 60]},
+    "embed_with_stickers": {"user": [3, 30], "guild": [20, 60]}
+}
+
+# Upper bounds for per-guild overrides (/settings set_cooldown and /settings import)
+COOLDOWN_MAX_REQUESTS = 1000
+COOLDOWN_MAX_PER_SECONDS = 86400
+
+# Heavy handlers allowed to run at once across all guilds
+MAX_CONCURRENT_HEAVY = 8
+
+# Extensions loaded at startup, in order. Anything listed in DISABLED_EXTENSIONS
+# is skipped (e.g. 'cogs.legacy' to drop the prefix commands) but can still be
+# loaded on demand with /extensions load.
+# Only the cogs/ modules are hot-reloaded. Shared modules they import (helpers,
+# settings_manager, rate_limiter, *_index, profiling) are not, so changes there
+# (e.g. to heavy_command or check_user_permissions) still need a restart.
+EXTENSIONS = [
+    'cogs.general',
+    'cogs.settings',
+    'cogs.embeds',
+    'cogs.legacy',
+    'cogs.admin',
+    'cogs.debug'
+]
+DISABLED_EXTENSIONS = []
+
+# Logging (see logging_setup.py): JSON lines in a rotating file plus console output
+LOG_FILE = 'bot.log'
+LOG_LEVEL = 'INFO'
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+# Share of successful command completions that get logged (errors are always logged)
+LOG_COMMAND_SAMPLE_RATE = 0.1
@@ -0,0 +1,68 @@
+import zlib
+from typing import Dict, Iterable, Set
+
+class EmojiIndex:
+    """Per-guild lookup of custom emojis by lowercase name"""
+    
+    def __init__(self):
+        self._indexes: Dict[int, Dict[str, str]] = {}  # guild_id: {name: "<:name:id>"}
+        self._fingerprints: Dict[int, int] = {}
+        self._verified: Set[int] = set()
+    
+    @staticmethod
+    def fingerprint(emojis: Iterable) -> int:
+        """Cheap checksum of a guild's emoji list, used to validate snapshot entries"""
+        return zlib.crc32(",".join(f"{emoji.id}:{emoji.name}" for emoji in emojis).encode('utf-8'))
+    
+    def rebuild(self, guild) -> Dict[str, str]:
+        """Build the index for a guild from its live emoji list"""
+        index = {}
+        for emoji in guild.emojis:
+            # First emoji wins on case-insensitive name clashes
+            index.setdefault(emoji.name.lower(), str(emoji))
+        
+        self._indexes[guild.id] = index
+        self._fingerprints[guild.id] = self.fingerprint(guild.emojis)
+        self._verified.add(guild.id)
+        return index
+    
+    def get(self, guild) -> Dict[str, str]:
+        """Get the index for a guild, checking snapshot-loaded entries on first use"""
+        index = self._indexes.get(guild.id)
+        
+        if index is not None:
+            if guild.id in self._verified:
+                return index
+            if self._fingerprints.get(guild.id) == self.fingerprint(guild.emojis):
+                self._verified.add(guild.id)
+                return index
+        
+        return self.rebuild(guild)
+    
+    def mark_stale(self, guild_id: int) -> None:
+        """Re-check the fingerprint on next use (e.g. after a reconnect, when
+        emoji changes made meanwhile produce no on_guild_emojis_update)"""
+        self._verified.discard(guild_id)
+    
+    def invalidate(self, guild_id: int) -> None:
+        """Drop the index for a guild (e.g. after its emojis changed)"""
+        self._indexes.pop(guild_id, None)
+        self._fingerprints.pop(guild_id, None)
+        self._verified.discard(guild_id)
+    
+    def to_snapshot(self) -> Dict:
+        """Serialise verified indexes for a warm-start snapshot"""
+        return {
+            str(guild_id): [self._fingerprints[guild_id], self._indexes[guild_id]]
+            for guild_id in self._verified
+        }
+    
+    def load_snapshot(self, data: Dict) -> int:
+        """Load indexes from a snapshot; they stay unverified until first use. Returns the guild count"""
+        for guild_str, (fingerprint, index) in data.items():
+            guild_id = int(guild_str)
+            self._indexes[guild_id] = index
+            self._fingerprints[guild_id] = fingerprint
+            self._verified.discard(guild_id)
+        
+        return len(data)
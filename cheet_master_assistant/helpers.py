@@ -0,0 +1,181 @@
+# Shared by the extensions in cogs/. This module is not reloaded by
+# /extensions reload, so changes here need a restart (see config.EXTENSIONS).
+import discord
+from discord.ext import commands
+from discord import app_commands
+import re
+import logging
+import functools
+from config import COOLDOWN_DEFAULTS, LOG_COMMAND_SAMPLE_RATE
+
+log = logging.getLogger(__name__)
+
+class OwnerOnly(app_commands.CheckFailure):
+    """Raised by owner-only cogs' interaction_check; on_app_command_error replies with the message"""
+    
+    def __init__(self):
+        super().__init__("❌ Ta komenda jest dostępna tylko dla właściciela bota!")
+
+async def ensure_owner(interaction: discord.Interaction) -> bool:
+    """interaction_check body for owner-only cogs"""
+    if not await interaction.client.is_owner(interaction.user):
+        raise OwnerOnly()
+    return True
+
+def get_color_from_string(color_input):
+    """Convert color string to discord.Color object"""
+    color_map = {
+        'red': discord.Color.red(),
+        'green': discord.Color.green(),
+        'blue': discord.Color.blue(),
+        'yellow': discord.Color.yellow(),
+        'orange': discord.Color.orange(),
+        'purple': discord.Color.purple(),
+        'magenta': discord.Color.magenta(),
+        'gold': discord.Color.gold(),
+        'dark_red': discord.Color.dark_red(),
+        'dark_green': discord.Color.dark_green(),
+        'dark_blue': discord.Color.dark_blue(),
+        'dark_purple': discord.Color.dark_purple(),
+        'dark_magenta': discord.Color.dark_magenta(),
+        'dark_gold': discord.Color.dark_gold(),
+        'black': discord.Color.from_rgb(0, 0, 0),
+        'white': discord.Color.from_rgb(255, 255, 255)
+    }
+    
+    if color_input.lower() in color_map:
+        return color_map[color_input.lower()]
+    elif color_input.startswith('#') and len(color_input) == 7:
+        try:
+            hex_color = int(color_input[1:], 16)
+            return discord.Color(hex_color)
+        except ValueError:
+            pass
+    
+    return discord.Color.blue()  # default
+
+def parse_custom_emojis(content, guild, emoji_index):
+    """Parse content for custom emoji patterns like :name:"""
+    if not guild:
+        return content
+    
+    index = emoji_index.get(guild)
+    if not index:
+        return content
+    
+    pattern = r':([a-zA-Z0-9_]+):'
+    return re.sub(pattern, lambda match: index.get(match.group(1).lower(), match.group(0)), content)
+
+# Discord allows up to 3 stickers per message
+MAX_STICKERS_PER_MESSAGE = 3
+
+def extract_stickers(content, guild, sticker_index):
+    """Pull :name: patterns that name guild stickers out of content.
+
+    Returns the remaining content and the matched available stickers (at most
+    MAX_STICKERS_PER_MESSAGE). Rendered custom emojis like <:name:id> are left alone,
+    so call this after parse_custom_emojis to give emojis priority.
+    """
+    if not guild:
+        return content, []
+    
+    index = sticker_index.get(guild)
+    if not index:
+        return content, []
+    
+    stickers = []
+    
+    def take_sticker(match):
+        sticker = index.get(match.group(1).lower())
+        # Unavailable stickers would make the whole send fail, so leave their text as is (like /embed rejects them)
+        if sticker is None or not sticker.available or len(stickers) >= MAX_STICKERS_PER_MESSAGE:
+            return match.group(0)
+        if sticker not in stickers:
+            stickers.append(sticker)
+        return ""
+    
+    pattern = r'(?<![<\w]):([a-zA-Z0-9_]+):(?!\d)'
+    return re.sub(pattern, take_sticker, content), stickers
+
+def check_user_permissions(interaction: discord.Interaction) -> bool:
+    """Check if user has permission to use bot commands"""
+    if not interaction.guild:
+        return True  # Allow in DMs
+    
+    # Get user's role IDs
+    user_role_ids = [role.id for role in interaction.user.roles]
+    
+    # Check if user is allowed
+    return interaction.client.settings_manager.is_user_allowed(interaction.guild.id, user_role_ids)
+
+def check_admin_permissions(interaction: discord.Interaction) -> bool:
+    """Check if user has admin permissions to manage bot settings"""
+    if not interaction.guild:
+        return False  # No admin in DMs
+    
+    # Check if user has manage roles or administrator permission
+    return (interaction.user.guild_permissions.manage_roles or 
+            interaction.user.guild_permissions.administrator)
+
+def heavy_command(command_name: str, check=None):
+    """Apply cooldowns and the in-flight cap to an expensive slash or prefix command.
+
+    Slash commands also get the allowed-role check (check_user_permissions) here,
+    so decorated command bodies must not repeat it.
+    Requests over the limit are shed before the command body runs, with an
+    ephemeral reply (slash) or a reaction (prefix). ``check`` is called as
+    ``check(source, **kwargs)`` with the command's arguments before any bucket is
+    touched; if it returns an error message the request is rejected with that reply.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            source = next(arg for arg in args if isinstance(arg, (discord.Interaction, commands.Context)))
+            user = source.user if isinstance(source, discord.Interaction) else source.author
+            guild_id = source.guild.id if source.guild else None
+            bot = source.client if isinstance(source, discord.Interaction) else source.bot
+            settings_manager, admission = bot.settings_manager, bot.admission
+            
+            # Users without an allowed role must not drain the guild's buckets
+            if isinstance(source, discord.Interaction) and not check_user_permissions(source):
+                await source.response.send_message("❌ Nie masz uprawnień do używania komend tego bota!", ephemeral=True)
+                return
+            
+            # Command-specific preconditions, so rejected requests never spend tokens either
+            error = check(source, **kwargs) if check else None
+            if error:
+                if isinstance(source, discord.Interaction):
+                    await source.response.send_message(error, ephemeral=True)
+                else:
+                    await source.send(error)
+                return
+            
+            # User limits are per guild, so user buckets are keyed per guild too
+            limits = []
+            for scope, key_id in (("user", (guild_id, user.id)), ("guild", guild_id)):
+                if key_id is None:
+                    continue
+                override = settings_manager.get_cooldown(guild_id, command_name, scope) if guild_id else None
+                rate, per = override or COOLDOWN_DEFAULTS[command_name][scope]
+                limits.append((scope, key_id, rate, per))
+            retry_after = admission.check_cooldowns(command_name, limits)
+            
+            if retry_after:
+                message = f"⏳ Zwolnij! Spróbuj ponownie za {retry_after:.0f}s."
+            elif not admission.try_enter(guild_id, settings_manager.get_max_concurrency(guild_id) if guild_id else None):
+                message = "⏳ Bot jest teraz zajęty, spróbuj ponownie za chwilę."
+            else:
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    admission.leave(guild_id)
+            
+            log.info('Request shed', extra={"guild": guild_id, "user": user.id, "command": command_name,
+                                             "error": "cooldown" if retry_after else "busy", "sample": LOG_COMMAND_SAMPLE_RATE})
+            if isinstance(source, discord.Interaction):
+                await source.response.send_message(message, ephemeral=True)
+            else:
+                await source.message.add_reaction("⏳")
+        
+        return wrapper
+    return decorator
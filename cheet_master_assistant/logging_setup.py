@@ -0,0 +1,83 @@
+import copy
+import json
+import logging
+import logging.handlers
+import queue
+import random
+from typing import Optional
+
+# Extra fields copied from log records into the JSON output when present
+STRUCTURED_FIELDS = ("guild", "user", "command", "latency_ms", "error")
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as one JSON object per line"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage()
+        }
+        
+        for field in STRUCTURED_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+class SamplingFilter(logging.Filter):
+    """Drops a share of records that carry a ``sample`` rate (0-1) in their extra fields.
+
+    Records without a rate always pass, so warnings and errors are never sampled away.
+    """
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        rate = getattr(record, "sample", None)
+        return rate is None or random.random() < rate
+
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves formatting to the listener thread.
+
+    The stock prepare() formats the whole record (including tracebacks) on the
+    calling thread so it can be pickled; our queue never leaves the process, so
+    only the message arguments are merged to freeze their current values.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+def setup_logging(log_file: str, level: int = logging.INFO, max_bytes: int = 5 * 1024 * 1024,
+                  backup_count: int = 5) -> logging.handlers.QueueListener:
+    """Route all logging through a queue to a background thread.
+
+    The event loop only enqueues records; a QueueListener thread writes JSON lines
+    to a rotating file and a readable line to the console. Call ``stop()`` on the
+    returned listener at shutdown to flush pending records.
+    """
+    log_queue: "queue.SimpleQueue[Optional[logging.LogRecord]]" = queue.SimpleQueue()
+    
+    queue_handler = _InProcessQueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter())
+    
+    root = logging.getLogger()
+    root.handlers.clear()
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+    
+    file_handler = logging.handlers.RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8')
+    file_handler.setFormatter(JsonFormatter())
+    
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)-8s %(name)s: %(message)s", "%H:%M:%S"))
+    
+    listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    return listener
@@ -0,0 +1,121 @@
+import asyncio
+import collections
+import cProfile
+import io
+import logging
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Counter, Deque, Iterable, Optional, Tuple
+
+FrameKey = Tuple[str, int, str]  # (filename, first line, function name)
+
+class SamplingProfiler:
+    """Statistical profiler that samples the stack of one thread from a background thread.
+
+    Unlike cProfile it does not hook every call, so it can run over a busy event
+    loop with little overhead. Nothing is installed until start() is called.
+    """
+    
+    def __init__(self, thread_id: int, interval: float = 0.005):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples = 0
+        self.self_counts: Counter[FrameKey] = collections.Counter()
+        self.total_counts: Counter[FrameKey] = collections.Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+    
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+    
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+                frame = frame.f_back
+            
+            self.samples += 1
+            self.self_counts[stack[0]] += 1
+            for key in set(stack):
+                self.total_counts[key] += 1
+    
+    def report(self, top: int) -> str:
+        """Top functions by own and cumulative samples"""
+        lines = [f"{self.samples} samples every {self.interval * 1000:.1f}ms", ""]
+        
+        for title, counts in (("Self (function on top of stack)", self.self_counts),
+                              ("Cumulative (function anywhere on stack)", self.total_counts)):
+            lines.append(title)
+            for (filename, lineno, name), count in counts.most_common(top):
+                lines.append(f"{count:8d} {count * 100 / max(self.samples, 1):6.1f}%  {name} ({filename}:{lineno})")
+            lines.append("")
+        
+        return "\n".join(lines)
+
+def format_cprofile(profiler: cProfile.Profile, top: int) -> str:
+    """Top functions of a cProfile run sorted by cumulative and own time"""
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    stats.sort_stats(pstats.SortKey.TIME).print_stats(top)
+    return stream.getvalue()
+
+def format_tracemalloc_diff(snapshot: tracemalloc.Snapshot, baseline: tracemalloc.Snapshot, top: int) -> str:
+    """Allocation sites whose memory grew the most since the baseline snapshot"""
+    filters = [
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>")
+    ]
+    snapshot = snapshot.filter_traces(filters)
+    baseline = baseline.filter_traces(filters)
+    
+    stats = snapshot.compare_to(baseline, "lineno")
+    total_diff = sum(stat.size_diff for stat in stats)
+    lines = [f"Total change: {total_diff / 1024:+.1f} KiB", ""]
+    lines.extend(str(stat) for stat in stats[:top])
+    return "\n".join(lines)
+
+class SlowCallbackBuffer(logging.Handler):
+    """Keeps the latest slow-callback warnings emitted by asyncio in debug mode"""
+    
+    def __init__(self, capacity: int = 50):
+        super().__init__(logging.WARNING)
+        self.records: Deque[str] = collections.deque(maxlen=capacity)
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        message = record.getMessage()
+        if message.startswith("Executing"):
+            self.records.append(f"{time.strftime('%H:%M:%S', time.localtime(record.created))} {message}")
+
+def format_tasks(tasks: Iterable[asyncio.Task], slow_callbacks: Iterable[str], stack_limit: int = 5) -> str:
+    """Pending asyncio tasks with their current stacks plus recent slow callbacks"""
+    tasks = sorted(tasks, key=lambda task: task.get_name())
+    stream = io.StringIO()
+    stream.write(f"{len(tasks)} pending tasks\n\n")
+    
+    for task in tasks:
+        stream.write(f"== {task.get_name()}: {task.get_coro()!r}\n")
+        task.print_stack(limit=stack_limit, file=stream)
+        stream.write("\n")
+    
+    slow_callbacks = list(slow_callbacks)
+    stream.write(f"Slow callbacks ({len(slow_callbacks)}):\n")
+    for line in slow_callbacks:
+        stream.write(f"{line}\n")
+    
+    return stream.getvalue()
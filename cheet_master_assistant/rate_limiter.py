@@ -0,0 +1,124 @@
+import time
+from typing import Dict, Hashable, Iterable, Optional, Tuple
+
+class TokenBucket:
+    """Token bucket refilled continuously at capacity / per tokens per second"""
+    
+    __slots__ = ("tokens", "updated", "capacity", "refill")
+    
+    def __init__(self, capacity: int, per: float, now: float):
+        self.capacity = capacity
+        self.refill = capacity / per
+        self.tokens = float(capacity)
+        self.updated = now
+    
+    def reconfigure(self, capacity: int, per: float, now: float) -> None:
+        """Apply new limits, keeping the current tokens (capped at the new capacity)"""
+        self.tokens = min(capacity, self.level(now))
+        self.updated = now
+        self.capacity = capacity
+        self.refill = capacity / per
+    
+    def level(self, now: float) -> float:
+        """Number of tokens available at ``now``"""
+        return min(self.capacity, self.tokens + (now - self.updated) * self.refill)
+    
+    def wait_time(self, now: float) -> float:
+        """Seconds until a token is available at ``now`` (0 if one is available), without taking it"""
+        level = self.level(now)
+        return 0.0 if level >= 1 else (1 - level) / self.refill
+    
+    def take(self, now: float) -> None:
+        """Take one token; call only after wait_time() returned 0"""
+        self.tokens = self.level(now) - 1
+        self.updated = now
+
+class AdmissionController:
+    """Per-user/per-guild token bucket cooldowns plus in-flight caps for heavy commands.
+
+    Buckets live in a single dict keyed by (command, scope, key). Buckets that have
+    refilled completely carry no information and are swept periodically, so memory
+    stays proportional to recently active users and guilds.
+    """
+    
+    def __init__(self, max_concurrency: int, sweep_interval: float = 60.0):
+        self.max_concurrency = max_concurrency
+        self.sweep_interval = sweep_interval
+        self._buckets: Dict[Tuple[str, str, int], TokenBucket] = {}
+        self._in_flight = 0
+        self._in_flight_by_guild: Dict[int, int] = {}
+        self._last_sweep = time.monotonic()
+    
+    def check_cooldowns(self, command: str, limits: Iterable[Tuple[str, Hashable, int, float]]) -> float:
+        """Admit a request against several buckets at once.
+
+        ``limits`` holds (scope, key, rate, per) tuples; the key must identify
+        everything the limits depend on (e.g. (guild_id, user_id) for per-guild
+        user limits). A token is taken from every
+        bucket only if all of them admit the request, so a user's token is not spent
+        when the guild bucket rejects it. Returns 0 if admitted, else the retry delay.
+        """
+        now = time.monotonic()
+        if now - self._last_sweep >= self.sweep_interval:
+            self.sweep(now)
+        
+        buckets = []
+        for scope, key_id, rate, per in limits:
+            key = (command, scope, key_id)
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(rate, per, now)
+            elif bucket.capacity != rate or bucket.refill != rate / per:
+                # Limits changed through /settings; do not hand out a fresh bucket
+                bucket.reconfigure(rate, per, now)
+            buckets.append(bucket)
+        
+        retry_after = max((bucket.wait_time(now) for bucket in buckets), default=0.0)
+        if not retry_after:
+            for bucket in buckets:
+                bucket.take(now)
+        
+        return retry_after
+    
+    def try_enter(self, guild_id: Optional[int], guild_limit: Optional[int] = None) -> bool:
+        """Reserve an in-flight slot; returns False if the global or guild cap is reached"""
+        if self._in_flight >= self.max_concurrency:
+            return False
+        
+        if guild_id is not None:
+            guild_in_flight = self._in_flight_by_guild.get(guild_id, 0)
+            if guild_limit is not None and guild_in_flight >= guild_limit:
+                return False
+            self._in_flight_by_guild[guild_id] = guild_in_flight + 1
+        
+        self._in_flight += 1
+        return True
+    
+    def leave(self, guild_id: Optional[int]) -> None:
+        """Release a slot reserved by try_enter"""
+        self._in_flight -= 1
+        
+        if guild_id is not None:
+            remaining = self._in_flight_by_guild.get(guild_id, 1) - 1
+            if remaining > 0:
+                self._in_flight_by_guild[guild_id] = remaining
+            else:
+                self._in_flight_by_guild.pop(guild_id, None)
+    
+    def sweep(self, now: Optional[float] = None) -> int:
+        """Drop buckets that have fully refilled; returns the number removed"""
+        now = time.monotonic() if now is None else now
+        expired = [key for key, bucket in self._buckets.items() if bucket.level(now) >= bucket.capacity]
+        
+        for key in expired:
+            del self._buckets[key]
+        
+        self._last_sweep = now
+        return len(expired)
+    
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+    
+    def __len__(self) -> int:
+        return len(self._buckets)
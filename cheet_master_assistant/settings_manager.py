@@ -1,13 +1,71 @@
 import json
+import logging
 import os
-from typing import List, Dict, Set
+from typing import Any, List, Dict, FrozenSet, Optional, Set
+from config import COOLDOWN_DEFAULTS, COOLDOWN_MAX_REQUESTS, COOLDOWN_MAX_PER_SECONDS, MAX_CONCURRENT_HEAVY
+
+log = logging.getLogger(__name__)
 
 class SettingsManager:
     """Manages bot settings including role permissions"""
     
     def __init__(self, settings_file: str = "settings.json"):
         self.settings_file = settings_file
-        self.settings = self._load_settings()
+        self._settings: Optional[Dict] = None
+        self._role_sets: Dict[str, FrozenSet[int]] = {}  # guild_id: frozenset of allowed role IDs
+        self._role_sets_complete = False  # True when _role_sets covers every guild in the file
+        self._primed_limits: Optional[Dict] = None  # {"cooldowns": ..., "max_concurrency": ...} from a snapshot
+    
+    @property
+    def settings(self) -> Dict:
+        """Parsed settings, loaded from disk on first access"""
+        if self._settings is None:
+            self._settings = self._load_settings()
+        return self._settings
+    
+    def file_fingerprint(self) -> Optional[List[int]]:
+        """Modification time and size of the settings file, or None if it does not exist"""
+        try:
+            stat = os.stat(self.settings_file)
+        except OSError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+    
+    def export_role_sets(self) -> Dict[str, List[int]]:
+        """Parsed allowed role sets of every guild, for a warm-start snapshot"""
+        if self._settings is None and self._role_sets_complete:
+            return {guild_str: sorted(role_ids) for guild_str, role_ids in self._role_sets.items()}
+        return {guild_str: sorted(role_ids) for guild_str, role_ids in self.settings["allowed_roles"].items()}
+    
+    def export_limits(self) -> Dict[str, Dict]:
+        """Cooldown and concurrency overrides of every guild, for a warm-start snapshot"""
+        return {
+            "cooldowns": self._limits_section("cooldowns"),
+            "max_concurrency": self._limits_section("max_concurrency")
+        }
+    
+    def prime_role_sets(self, role_sets: Dict[str, List[int]], fingerprint: Optional[List[int]],
+                        limits: Optional[Dict[str, Dict]] = None) -> bool:
+        """Use role sets (and command limits) from a snapshot if the settings file has not changed since it was taken.
+
+        Permission checks and cooldown/concurrency lookups are then answered without
+        parsing settings.json until the first settings change. Without ``limits`` the
+        first heavy command still parses the file. Returns True if the snapshot was accepted.
+        """
+        if fingerprint is None or fingerprint != self.file_fingerprint():
+            return False
+        
+        self._role_sets = {guild_str: frozenset(role_ids) for guild_str, role_ids in role_sets.items()}
+        self._role_sets_complete = True
+        if isinstance(limits, dict):
+            self._primed_limits = limits
+        return True
+    
+    def _limits_section(self, name: str) -> Dict:
+        """A per-guild limits section, served from the snapshot while settings.json is unparsed"""
+        if self._settings is None and self._primed_limits is not None:
+            return self._primed_limits.get(name, {})
+        return self.settings.get(name, {})
     
     def _load_settings(self) -> Dict:
         """Load settings from file or create default settings"""
@@ -21,16 +79,23 @@ class SettingsManager:
         # Default settings
         return {
             "allowed_roles": {},  # guild_id: [role_id1, role_id2, ...]
+            "cooldowns": {},  # guild_id: {command: {"user"|"guild": [requests, per_seconds]}}
+            "max_concurrency": {},  # guild_id: max heavy commands in flight
             "version": "1.0"
         }
     
     def _save_settings(self) -> None:
         """Save settings to file"""
+        # Every mutation goes through here, so drop the derived role sets
+        self._role_sets = {}
+        self._role_sets_complete = False
+        self._primed_limits = None
+        
         try:
             with open(self.settings_file, 'w', encoding='utf-8') as f:
                 json.dump(self.settings, f, indent=2, ensure_ascii=False)
         except Exception as e:
-            print(f"❌ Error saving settings: {e}")
+            log.error("Error saving settings", extra={"error": repr(e)})
     
     def add_allowed_role(self, guild_id: int, role_id: int) -> bool:
         """Add a role to the allowed roles list for a guild"""
@@ -58,6 +123,37 @@ class SettingsManager:
         
         return False  # Role not found
     
+    def add_allowed_roles(self, guild_id: int, role_ids: List[int]) -> List[int]:
+        """Add several roles to the allowed roles list with a single save.
+
+        Returns the role IDs that were actually added (already present ones are skipped).
+        """
+        guild_str = str(guild_id)
+        current = self.settings["allowed_roles"].get(guild_str, [])
+        
+        added = [role_id for role_id in dict.fromkeys(role_ids) if role_id not in current]
+        if added:
+            self.settings["allowed_roles"][guild_str] = current + added
+            self._save_settings()
+        
+        return added
+    
+    def remove_allowed_roles(self, guild_id: int, role_ids: List[int]) -> List[int]:
+        """Remove several roles from the allowed roles list with a single save.
+
+        Returns the role IDs that were actually removed (unknown ones are skipped).
+        """
+        guild_str = str(guild_id)
+        current = self.settings["allowed_roles"].get(guild_str, [])
+        
+        to_remove = set(role_ids)
+        removed = [role_id for role_id in current if role_id in to_remove]
+        if removed:
+            self.settings["allowed_roles"][guild_str] = [role_id for role_id in current if role_id not in to_remove]
+            self._save_settings()
+        
+        return removed
+    
     def get_allowed_roles(self, guild_id: int) -> List[int]:
         """Get list of allowed role IDs for a guild"""
         guild_str = str(guild_id)
@@ -65,14 +161,27 @@ class SettingsManager:
     
     def is_user_allowed(self, guild_id: int, user_roles: List[int]) -> bool:
         """Check if user has any of the allowed roles"""
-        allowed_roles = self.get_allowed_roles(guild_id)
+        allowed_roles = self._get_role_set(guild_id)
         
         # If no roles are configured, allow everyone
         if not allowed_roles:
             return True
         
         # Check if user has any of the allowed roles
-        return any(role_id in allowed_roles for role_id in user_roles)
+        return not allowed_roles.isdisjoint(user_roles)
+    
+    def _get_role_set(self, guild_id: int) -> FrozenSet[int]:
+        """Get the allowed role IDs of a guild as a cached frozenset"""
+        guild_str = str(guild_id)
+        role_set = self._role_sets.get(guild_str)
+        
+        if role_set is None:
+            if self._role_sets_complete:
+                return frozenset()
+            role_set = frozenset(self.get_allowed_roles(guild_id))
+            self._role_sets[guild_str] = role_set
+        
+        return role_set
     
     def clear_guild_settings(self, guild_id: int) -> bool:
         """Clear all settings for a guild"""
@@ -84,4 +193,113 @@ class SettingsManager:
             return True
         
         return False
+    
+    def get_cooldown(self, guild_id: int, command: str, scope: str) -> Optional[List]:
+        """Get the [requests, per_seconds] override for a command and scope ("user" or "guild")"""
+        return self._limits_section("cooldowns").get(str(guild_id), {}).get(command, {}).get(scope)
+    
+    def get_guild_cooldowns(self, guild_id: int) -> Dict[str, Dict[str, List]]:
+        """Get all cooldown overrides of a guild"""
+        return self._limits_section("cooldowns").get(str(guild_id), {})
+    
+    def set_cooldown(self, guild_id: int, command: str, scope: str, rate: Optional[int], per: Optional[int] = None) -> None:
+        """Override the cooldown of a command for a guild; rate=None restores the default"""
+        guild_cooldowns = self.settings.setdefault("cooldowns", {}).setdefault(str(guild_id), {})
+        
+        if rate is None:
+            command_cooldowns = guild_cooldowns.get(command, {})
+            command_cooldowns.pop(scope, None)
+            if command in guild_cooldowns and not command_cooldowns:
+                del guild_cooldowns[command]
+        else:
+            guild_cooldowns.setdefault(command, {})[scope] = [rate, per]
+        
+        self._save_settings()
+    
+    def get_max_concurrency(self, guild_id: int) -> Optional[int]:
+        """Get the per-guild cap on heavy commands in flight, if one is set"""
+        return self._limits_section("max_concurrency").get(str(guild_id))
+    
+    def set_max_concurrency(self, guild_id: int, limit: Optional[int]) -> None:
+        """Set the per-guild cap on heavy commands in flight; None removes it"""
+        max_concurrency = self.settings.setdefault("max_concurrency", {})
+        
+        if limit is None:
+            max_concurrency.pop(str(guild_id), None)
+        else:
+            max_concurrency[str(guild_id)] = limit
+        
+        self._save_settings()
+    
+    def export_guild_settings(self, guild_id: int) -> Dict:
+        """Export the whole configuration of a guild as a JSON-serialisable dict"""
+        return {
+            "version": self.settings.get("version", "1.0"),
+            "allowed_roles": list(self.get_allowed_roles(guild_id)),
+            "cooldowns": self.get_guild_cooldowns(guild_id),
+            "max_concurrency": self.get_max_concurrency(guild_id)
+        }
+    
+    def import_guild_settings(self, guild_id: int, data: Any, known_role_ids: Optional[Set[int]] = None) -> Dict:
+        """Validate and replace the configuration of a guild with a single save.
 
+        Raises ValueError if the data is malformed or references roles outside
+        ``known_role_ids`` (when given); nothing is changed in that case.
+        Returns the normalised configuration that was stored.
+        """
+        if not isinstance(data, dict):
+            raise ValueError("Plik musi zawierać obiekt JSON")
+        
+        raw_roles = data.get("allowed_roles", [])
+        if not isinstance(raw_roles, list):
+            raise ValueError("Pole 'allowed_roles' musi być listą ID ról")
+        
+        role_ids = []
+        for raw_role in raw_roles:
+            # IDs may come back as strings if the file was edited by hand
+            if isinstance(raw_role, bool) or not isinstance(raw_role, (int, str)) or not str(raw_role).isdigit():
+                raise ValueError(f"Nieprawidłowe ID roli: {raw_role!r}")
+            role_id = int(raw_role)
+            if role_id not in role_ids:
+                role_ids.append(role_id)
+        
+        if known_role_ids is not None:
+            unknown = [role_id for role_id in role_ids if role_id not in known_role_ids]
+            if unknown:
+                raise ValueError("Nieznane role na tym serwerze: " + ", ".join(str(role_id) for role_id in unknown))
+        
+        cooldowns = data.get("cooldowns", {})
+        if not isinstance(cooldowns, dict):
+            raise ValueError("Pole 'cooldowns' musi być obiektem")
+        
+        for command, scopes in cooldowns.items():
+            if command not in COOLDOWN_DEFAULTS:
+                raise ValueError(f"Nieznana komenda w cooldownach: {command!r}")
+            if not isinstance(scopes, dict):
+                raise ValueError(f"Nieprawidłowy cooldown komendy {command!r}")
+            for scope, limit in scopes.items():
+                # Same ranges as /settings set_cooldown
+                if (scope not in ("user", "guild") or not isinstance(limit, list) or len(limit) != 2
+                        or not self._is_int_in_range(limit[0], 1, COOLDOWN_MAX_REQUESTS)
+                        or not self._is_int_in_range(limit[1], 1, COOLDOWN_MAX_PER_SECONDS)):
+                    raise ValueError(f"Nieprawidłowy cooldown komendy {command!r}: {scope!r}")
+        
+        max_concurrency = data.get("max_concurrency")
+        if max_concurrency is not None and not self._is_int_in_range(max_concurrency, 1, MAX_CONCURRENT_HEAVY):
+            raise ValueError(f"Pole 'max_concurrency' musi być liczbą całkowitą od 1 do {MAX_CONCURRENT_HEAVY}")
+        
+        guild_str = str(guild_id)
+        self.settings["allowed_roles"][guild_str] = role_ids
+        self.settings.setdefault("cooldowns", {})[guild_str] = cooldowns
+        if max_concurrency is None:
+            self.settings.setdefault("max_concurrency", {}).pop(guild_str, None)
+        else:
+            self.settings.setdefault("max_concurrency", {})[guild_str] = max_concurrency
+        self._save_settings()
+        
+        return self.export_guild_settings(guild_id)
+    
+    @staticmethod
+    def _is_int_in_range(value: Any, minimum: int, maximum: int) -> bool:
+        """Check that value is a real int (not bool) within [minimum, maximum]"""
+        return isinstance(value, int) and not isinstance(value, bool) and minimum <= value <= maximum
@@ -0,0 +1,36 @@
+import json
+import os
+import zlib
+from typing import Dict, Optional
+
+# File layout: 4-byte magic, 1-byte format version, zlib-compressed JSON body
+SNAPSHOT_MAGIC = b"CMAS"
+SNAPSHOT_VERSION = 1
+
+def save_snapshot(path: str, data: Dict) -> None:
+    """Write derived state to a compact binary snapshot (atomically replaces the old one)"""
+    body = zlib.compress(json.dumps(data, separators=(',', ':')).encode('utf-8'))
+    tmp_path = f"{path}.tmp"
+    
+    with open(tmp_path, 'wb') as f:
+        f.write(SNAPSHOT_MAGIC + bytes([SNAPSHOT_VERSION]) + body)
+    os.replace(tmp_path, path)
+
+def load_snapshot(path: str) -> Optional[Dict]:
+    """Read a snapshot written by save_snapshot; returns None if it is missing, stale or corrupt"""
+    try:
+        with open(path, 'rb') as f:
+            raw = f.read()
+    except OSError:
+        return None
+    
+    header_size = len(SNAPSHOT_MAGIC) + 1
+    if raw[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC or raw[header_size - 1:header_size] != bytes([SNAPSHOT_VERSION]):
+        return None
+    
+    try:
+        data = json.loads(zlib.decompress(raw[header_size:]))
+    except (zlib.error, ValueError):
+        return None
+    
+    return data if isinstance(data, dict) else None
@@ -0,0 +1,33 @@
+from typing import Dict, Iterable, Optional
+
+class StickerIndex:
+    """Per-guild lookup of guild stickers by lowercase name"""
+    
+    def __init__(self):
+        self._indexes: Dict[int, Dict[str, object]] = {}  # guild_id: {name: GuildSticker}
+    
+    def update(self, guild_id: int, stickers: Iterable) -> Dict[str, object]:
+        """Replace the index for a guild (called from on_guild_stickers_update)"""
+        index = {}
+        for sticker in stickers:
+            # First sticker wins on case-insensitive name clashes
+            index.setdefault(sticker.name.lower(), sticker)
+        
+        self._indexes[guild_id] = index
+        return index
+    
+    def get(self, guild) -> Dict[str, object]:
+        """Get the index for a guild, building it from the guild cache on first use"""
+        index = self._indexes.get(guild.id)
+        if index is None:
+            index = self.update(guild.id, guild.stickers)
+        return index
+    
+    def find(self, guild, name: str) -> Optional[object]:
+        """Find a guild sticker by name, with or without surrounding colons"""
+        return self.get(guild).get(name.strip().strip(':').lower())
+    
+    def invalidate(self, guild_id: int) -> None:
+        """Drop the index for a guild (after the bot left it, or when the guild is rebuilt
+        after a reconnect and changes made meanwhile produced no sticker update event)"""
+        self._indexes.pop(guild_id, None)